@@ -28,23 +28,22 @@ def ensure_google_creds_file() -> str | None:
     if not GOOGLE_CREDS_B64:
         return None
     try:
-        # detect if it's base64
-        maybe_json = None
+        # detect if it's base64 (tolerating stripped padding); the decoded
+        # bytes are validated as JSON and written as-is, no re-serialize
+        padded = GOOGLE_CREDS_B64 + "=" * (-len(GOOGLE_CREDS_B64) % 4)
         try:
-            decoded = base64.b64decode(GOOGLE_CREDS_B64).decode("utf-8")
-            maybe_json = json.loads(decoded)
+            creds_bytes = base64.b64decode(padded)
+            json.loads(creds_bytes)
         except Exception:
             # maybe it's raw JSON
             try:
-                maybe_json = json.loads(GOOGLE_CREDS_B64)
+                creds_bytes = GOOGLE_CREDS_B64.encode("utf-8")
+                json.loads(creds_bytes)
             except Exception:
-                maybe_json = None
-
-        if maybe_json is None:
-            return None
+                return None
 
         creds_path = BASE_DIR.parent / "google_creds.json"
-        creds_path.write_text(json.dumps(maybe_json))
+        creds_path.write_bytes(creds_bytes)
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(creds_path)
         return str(creds_path)
     except Exception:
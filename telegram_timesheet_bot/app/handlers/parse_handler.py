@@ -1,5 +1,10 @@
 from .. import telegram_bot, ocr, service, sheets, config
-from ..state import update, PENDING_UPLOADS
+from ..state import update, set_pending, pop_pending
+
+# Telegram bots can only download files up to 20 MB; anything larger, or not
+# an image/PDF, is rejected before spending a download and an OCR call on it.
+MAX_FILE_BYTES = 20 * 1024 * 1024
+SUPPORTED_DOC_MIME_PREFIXES = ("image/", "application/pdf")
 
 
 def start(chat_id):
@@ -13,15 +18,33 @@ def handle(chat_id, msg):
 
     file_id = None
     filename = None
+    file_size = 0
 
     photos = msg.get("photo")
     if photos:
         file_id = photos[-1]["file_id"]
+        file_size = photos[-1].get("file_size") or 0
 
     doc = msg.get("document")
     if doc:
+        mime_type = doc.get("mime_type")
+        if mime_type and not mime_type.startswith(SUPPORTED_DOC_MIME_PREFIXES):
+            telegram_bot.send_message(chat_id, """
+                                      🤖 Extraction Mode
+                                      => Unsupported file type. Send an image or PDF.
+                                      """)
+            return
+
         file_id = doc.get("file_id")
         filename = doc.get("file_name")
+        file_size = doc.get("file_size") or 0
+
+    if file_size > MAX_FILE_BYTES:
+        telegram_bot.send_message(chat_id, """
+                                  🤖 Extraction Mode
+                                  => File is too large (max 20 MB).
+                                  """)
+        return
 
     if not file_id:
         telegram_bot.send_message(chat_id, """
@@ -59,15 +82,16 @@ def handle(chat_id, msg):
                                   """)
         return
 
-    reply_text = service.trips_to_message(parsed["entries"])
-    sheet_rows = service.trips_to_sheet_rows(parsed["entries"])
+    trips = service.group_trips(parsed["entries"])
+    reply_text = service.trips_to_message(parsed["entries"], trips)
+    sheet_rows = service.trips_to_sheet_rows(parsed["entries"], trips)
 
     telegram_bot.send_message(chat_id, reply_text)
 
     if chat_id not in config.TRUSTED_CHAT_IDS:
         return
 
-    PENDING_UPLOADS[chat_id] = sheet_rows
+    set_pending(chat_id, sheet_rows)
 
     keyboard = {
         "inline_keyboard": [[
@@ -92,7 +116,7 @@ def callback(chat_id, data):
 
     if data == "CONFIRM_YES":
 
-        pending = PENDING_UPLOADS.pop(chat_id, None)
+        pending = pop_pending(chat_id)
 
         if not pending:
             telegram_bot.send_message(chat_id, """
@@ -129,7 +153,7 @@ def callback(chat_id, data):
 
     if data == "CONFIRM_NO":
 
-        PENDING_UPLOADS.pop(chat_id, None)
+        pop_pending(chat_id)
 
         telegram_bot.send_message(
             chat_id,
@@ -1,10 +1,12 @@
 import logging
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from . import router
 from app import telegram_bot, config
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 logger = logging.getLogger("uvicorn.error")
 
 def isAuthorized(chat_id: any):
@@ -14,9 +16,12 @@ def isAuthorized(chat_id: any):
     )
 
 @app.post("/{webhook_path}")
-async def telegram_webhook(webhook_path: str, request: Request):
+async def telegram_webhook(webhook_path: str, request: Request, background_tasks: BackgroundTasks):
+    # Acknowledge Telegram straight away. Replies, downloads, OCR and Sheets
+    # calls are blocking, so they run as background tasks in the threadpool
+    # after the 200 has been sent.
 
-    update = await request.json()
+    update = orjson.loads(await request.body())
 
     callback = update.get("callback_query")
 
@@ -24,7 +29,8 @@ async def telegram_webhook(webhook_path: str, request: Request):
 
         chat_id = callback["message"]["chat"]["id"]
         if not isAuthorized(chat_id):
-            telegram_bot.answer_callback_query(
+            background_tasks.add_task(
+                telegram_bot.answer_callback_query,
                 callback["id"],
                 text="❌ You are not authorized to use this bot.",
                 show_alert=True
@@ -34,8 +40,10 @@ async def telegram_webhook(webhook_path: str, request: Request):
         data = callback["data"]
         callback_id = callback["id"]
 
-        telegram_bot.answer_callback_query(callback_id)
-        router.route_callback(chat_id, data)
+        # Route first: background tasks stop at the first exception, and a
+        # failed ack (e.g. an expired query id) must not drop the confirmation
+        background_tasks.add_task(router.route_callback, chat_id, data)
+        background_tasks.add_task(telegram_bot.answer_callback_query, callback_id)
 
         return {"ok": True}
 
@@ -47,14 +55,15 @@ async def telegram_webhook(webhook_path: str, request: Request):
 
     chat_id = msg["chat"]["id"]
     if not isAuthorized(chat_id):
-        telegram_bot.send_message(
+        background_tasks.add_task(
+            telegram_bot.send_message,
             chat_id,
             "❌ You are not authorized to use this bot."
         )
         return {"ok": True}
     text = msg.get("text")
 
-    router.route_message(chat_id, text, msg)
+    background_tasks.add_task(router.route_message, chat_id, text, msg)
 
     return {"ok": True}
 
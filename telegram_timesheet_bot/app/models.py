@@ -1,3 +1,4 @@
+import datetime
 from dataclasses import dataclass
 from typing import Optional
 
@@ -18,6 +19,7 @@ class FlightRow:
     duty_time: Optional[str] = None
     fdp: Optional[str] = None
     raw_block: Optional[str] = None
+    day: Optional[datetime.date] = None # start_date parsed once at parse time
 
     def __str__(self):
         return f"{self.start_date} | {self.flight_number} | {self.sector} | {self.duty_type} | {self.trip_type} | {self.rpt} | {self.std} | {self.sta} | {self.duty_time} | {self.flight_time}"
\ No newline at end of file
@@ -5,13 +5,41 @@ from __future__ import annotations
 import os
 import json
 import base64
+import io
 import math
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict
 
-def _get_vision_client():
+try:
     from google.cloud import vision
+    from google.oauth2 import service_account
+except ImportError:  # Vision is optional; OCR calls fail soft without it
+    vision = None
+    service_account = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # without Pillow images are sent to Vision unchanged
+    Image = None
+    ImageOps = None
 
-    creds_b64 = os.getenv("GOOGLE_CREDS_B64")
+GOOGLE_CREDS_B64 = os.getenv("GOOGLE_CREDS_B64")
+
+# Long-side cap for images sent to Vision. Roster text stays well above the
+# recommended glyph height at this size while uploads shrink several-fold.
+MAX_OCR_SIDE = 2048
+
+# batch_annotate_files only OCRs this many pages of a PDF per request
+MAX_PDF_PAGES = 5
+
+@lru_cache(maxsize=1)
+def _get_vision_client():
+    """Build the Vision client once; credentials and gRPC channel are reused."""
+    if vision is None:
+        raise RuntimeError("google-cloud-vision is not installed")
+
+    creds_b64 = GOOGLE_CREDS_B64
 
     if not creds_b64:
         raise RuntimeError("GOOGLE_CREDS_B64 not set")
@@ -23,21 +51,18 @@ def _get_vision_client():
     creds_json = base64.b64decode(creds_b64).decode("utf-8")
     creds_dict = json.loads(creds_json)
 
-    from google.oauth2 import service_account
     credentials = service_account.Credentials.from_service_account_info(creds_dict)
 
     return vision.ImageAnnotatorClient(credentials=credentials)
 
-def _fill_missing_vertices(vertices):
-    fixed = []
-    for v in vertices:
-        x = v.x if v.x is not None else 0
-        y = v.y if v.y is not None else 0
-        fixed.append({"x": x, "y": y})
-    return fixed
+def _vertex_coords(vertices):
+    xs = [v.x if v.x is not None else 0 for v in vertices]
+    ys = [v.y if v.y is not None else 0 for v in vertices]
+    return xs, ys
 
 
-def group_words_by_line(text_annotations, y_threshold_ratio=0.6):
+def _annotation_words(text_annotations):
+    """Flat (avg_y, avg_x, height, text) tuples from image text annotations."""
     words = []
 
     # Skip index 0 (full text blob)
@@ -45,41 +70,77 @@ def group_words_by_line(text_annotations, y_threshold_ratio=0.6):
         if not item.bounding_poly or not item.bounding_poly.vertices:
             continue
 
-        vertices = _fill_missing_vertices(item.bounding_poly.vertices)
+        xs, ys = _vertex_coords(item.bounding_poly.vertices)
+
+        words.append((
+            sum(ys) / 4,
+            sum(xs) / 4,
+            abs(ys[0] - ys[3]),
+            item.description,
+        ))
+
+    return words
 
-        words.append({
-            "text": item.description,
-            "vertices": vertices,
-            "avg_y": sum(v["y"] for v in vertices) / 4,
-            "avg_x": sum(v["x"] for v in vertices) / 4,
-            "height": abs(vertices[0]["y"] - vertices[3]["y"]),
-        })
 
+def _page_words(full_text_annotation):
+    """Same tuples for file (PDF) responses, which only carry full_text_annotation.
+
+    Their word boxes use normalized (0..1) vertices, so scale them by the page
+    size to keep the line threshold comparable with image responses.
+    """
+    words = []
+
+    for page in full_text_annotation.pages:
+        width = page.width or 1
+        height = page.height or 1
+
+        for block in page.blocks:
+            for paragraph in block.paragraphs:
+                for word in paragraph.words:
+                    vertices = word.bounding_box.normalized_vertices
+                    if not vertices:
+                        continue
+
+                    xs, ys = _vertex_coords(vertices)
+                    xs = [x * width for x in xs]
+                    ys = [y * height for y in ys]
+
+                    words.append((
+                        sum(ys) / 4,
+                        sum(xs) / 4,
+                        abs(ys[0] - ys[3]),
+                        "".join(symbol.text for symbol in word.symbols),
+                    ))
+
+    return words
+
+
+def group_words_by_line(words, y_threshold_ratio=0.6):
+    # Each word is a flat (avg_y, avg_x, height, text) tuple; no per-word dicts
     # Sort top → bottom
-    words.sort(key=lambda w: w["avg_y"])
+    words.sort(key=itemgetter(0))
 
     lines = []
     current_line = []
     current_y = None
-    current_height = None
+    threshold = None
 
     for word in words:
+        avg_y = word[0]
+
         if not current_line:
             current_line = [word]
-            current_y = word["avg_y"]
-            current_height = word["height"]
+            current_y = avg_y
+            threshold = word[2] * y_threshold_ratio
             continue
 
-        y_diff = abs(word["avg_y"] - current_y)
-        threshold = current_height * y_threshold_ratio
-
-        if y_diff <= threshold:
+        if abs(avg_y - current_y) <= threshold:
             current_line.append(word)
         else:
             lines.append(current_line)
             current_line = [word]
-            current_y = word["avg_y"]
-            current_height = word["height"]
+            current_y = avg_y
+            threshold = word[2] * y_threshold_ratio
 
     if current_line:
         lines.append(current_line)
@@ -87,38 +148,96 @@ def group_words_by_line(text_annotations, y_threshold_ratio=0.6):
     # Sort left → right
     final_lines = []
     for line in lines:
-        line.sort(key=lambda w: w["avg_x"])
-        final_lines.append(" ".join(w["text"] for w in line))
+        line.sort(key=itemgetter(1))
+        final_lines.append(" ".join(w[3] for w in line))
 
     return final_lines
 
+def _response_to_text(response) -> str:
+    if response.error.message:
+        raise Exception(response.error.message)
+
+    if response.text_annotations:
+        words = _annotation_words(response.text_annotations)
+    else:
+        # File (PDF) responses only carry the full-text annotation
+        words = _page_words(response.full_text_annotation)
+
+    return "\n".join(group_words_by_line(words))
+
+def _shrink_for_ocr(image_bytes: bytes) -> bytes:
+    """Downscale and grayscale oversized photos; smaller images pass through untouched."""
+    if Image is None:
+        return image_bytes
+
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        if max(img.size) <= MAX_OCR_SIDE:
+            return image_bytes
+
+        # Re-encoding drops EXIF, so apply the orientation first
+        img = ImageOps.exif_transpose(img)
+
+        # Flatten transparency onto white; a bare convert("L") turns dark
+        # text on a transparent background into an all-black page
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGBA", img.size, "white")
+            img = Image.alpha_composite(background, img)
+
+        img = img.convert("L")
+        img.thumbnail((MAX_OCR_SIDE, MAX_OCR_SIDE), Image.LANCZOS)
+
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=90)
+        return buf.getvalue()
+    except Exception:
+        return image_bytes
+
 def image_bytes_to_text(image_bytes: bytes) -> str:
     try:
-        from google.cloud import vision
         client = _get_vision_client()
 
-        image = vision.Image(content=image_bytes)
+        image = vision.Image(content=_shrink_for_ocr(image_bytes))
         response = client.document_text_detection(image=image)
 
-        if response.error.message:
-            raise Exception(response.error.message)
+        return _response_to_text(response)
 
-        annotations = response.text_annotations
+    except Exception as e:
+        print("Vision OCR failed:", e)
+        return ""
+
+def pdf_bytes_to_text(pdf_bytes: bytes) -> str:
+    """OCR every page of a PDF in a single Vision request (first 5 pages)."""
+    try:
+        client = _get_vision_client()
+
+        request = vision.AnnotateFileRequest(
+            input_config=vision.InputConfig(content=pdf_bytes, mime_type="application/pdf"),
+            features=[vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)],
+        )
+        response = client.batch_annotate_files(requests=[request])
+        file_response = response.responses[0]
+
+        if file_response.error.message:
+            raise Exception(file_response.error.message)
 
-        if not annotations:
-            return ""
+        if file_response.total_pages > MAX_PDF_PAGES:
+            print(
+                f"Vision PDF OCR: only the first {MAX_PDF_PAGES} of "
+                f"{file_response.total_pages} pages were read"
+            )
 
-        lines = group_words_by_line(annotations)
-        return "\n".join(lines)
+        pages = [_response_to_text(page) for page in file_response.responses]
+        return "\n".join(p for p in pages if p)
 
     except Exception as e:
-        print("Vision OCR failed:", e)
+        print("Vision PDF OCR failed:", e)
         return ""
 
 def extract_text_from_file(file_bytes: bytes, filename: str | None = None) -> str:
     name = (filename or "").lower()
     if name.endswith(".pdf"):
-        raise Exception("PDF OCR not implemented yet. Please convert to image first.")
+        return pdf_bytes_to_text(file_bytes)
     else:
         return image_bytes_to_text(file_bytes)
-
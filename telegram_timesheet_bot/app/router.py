@@ -1,4 +1,4 @@
-from .state import get, set, clear, PENDING_UPLOADS
+from .state import get, set, clear, pop_pending
 from .handlers import parse_handler, availability_handler
 from app import telegram_bot
 
@@ -24,7 +24,7 @@ def route_message(chat_id, text, msg):
 
     if text == "/cancel":
         clear(chat_id)
-        PENDING_UPLOADS.pop(chat_id, None)
+        pop_pending(chat_id)
 
         telegram_bot.send_message(
             chat_id,
@@ -5,24 +5,60 @@ Parsing and processing logic for extracting structured data from timesheet image
 import datetime
 import re
 import calendar
+from functools import lru_cache
 from typing import List, Dict
 from app.models import FlightRow
 
-OFF_DUTY_REGEX_STR = r"^(ATDO|AALV|OFFD)$"
-STANDBY_DUTY_REGEX_STR = r"(SS\d+)|(STBY)"
-LAYOVER_REGEX_STR = r"\bLO\b"
-TIMES_REGEX_STR = r"\b\d{4}\b"
-DURATIONS_REGEX_STR = r"\b\d{2}\s?:\s?\d{2}\b"
-FLIGHT_NUMBER_REGEX_STR = r"(SQ\s?\d+)"
-SECTOR_REGEX_STR = r"([A-Z]{3})\s?-\s?([A-Z]{3})"
-SINGLE_SECTOR_REGEX_STR = r"\b[A-Z]{3}\b"
+OFF_DUTY_CODES = frozenset(("ATDO", "AALV", "OFFD"))
+STANDBY_DUTY_REGEX = re.compile(r"(SS\d+)|(STBY)")
+LAYOVER_REGEX = re.compile(r"\bLO\b")
+# HHMM times and HH:MM durations in one scan. The two shapes can never overlap
+# (a duration's digit pairs are 2-digit words), so this finds exactly what
+# separate findall passes for each group would.
+TIMES_DURATIONS_REGEX = re.compile(r"(?P<dur>\b\d{2}\s?:\s?\d{2}\b)|(?P<time>\b\d{4}\b)")
+FLIGHT_NUMBER_REGEX = re.compile(r"(SQ\s?\d+)")
+SECTOR_REGEX = re.compile(r"([A-Z]{3})\s?-\s?([A-Z]{3})")
+SINGLE_SECTOR_REGEX = re.compile(r"\b[A-Z]{3}\b")
+DATE_REGEX = re.compile(r"\d{2}\W?[A-Za-z]{3}\W?\d{2}")
+
+# Availability summary patterns
+SUMMARY_HEADER_REGEX = re.compile(r"Flights\s+for\s+([A-Z]+)\s+(\d{4})")
+SUMMARY_DATE_RANGE_REGEX = re.compile(r"(\d{2})([A-Za-z]{3})\s*-\s*(\d{2})([A-Za-z]{3})")
+SUMMARY_TIME_REGEX = re.compile(r"(\d{2}:\d{2})")
 
 INTERNATIONAL_US_AIRPORTS = {"IAH", "LAX", "JFK", "EWR", "SFO", "SEA"}
 
+# Fixed English abbreviations so parsing and formatting do not depend on the locale
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTHS = {m.lower(): i for i, m in enumerate(_MONTH_ABBRS, start=1)}
+_MONTH_NAMES = ("JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
+                "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER")
+_MONTH_NAME_NUMBERS = {m: i for i, m in enumerate(_MONTH_NAMES, start=1)}
+
+@lru_cache(maxsize=512)
 def _parse_date_str(date_str: str) -> datetime.date:
     """Convert '01Mar26' → datetime.date(2026,3,1)"""
-    return datetime.datetime.strptime(date_str, "%d%b%y").date()
+    month = _MONTHS.get(date_str[2:5].lower())
+    if len(date_str) != 7 or not month or not (date_str[:2] + date_str[5:]).isdigit():
+        raise ValueError(f"time data {date_str!r} does not match format '%d%b%y'")
+
+    yy = int(date_str[5:])
+    # Same pivot as strptime's %y: 69-99 → 1900s, 00-68 → 2000s
+    return datetime.date(yy + (1900 if yy >= 69 else 2000), month, int(date_str[:2]))
+
+def _format_day_month(d: datetime.date) -> str:
+    """datetime.date(2026,3,1) → '01Mar' (strftime '%d%b')"""
+    return f"{d.day:02d}{_MONTH_ABBRS[d.month - 1]}"
+
+def _format_sheet_date(d: datetime.date) -> str:
+    """datetime.date(2026,3,1) → '03/01/2026' (strftime '%m/%d/%Y')"""
+    return f"{d.month:02d}/{d.day:02d}/{d.year}"
 
+def _entry_day(e: FlightRow) -> datetime.date:
+    return e.day or _parse_date_str(e.start_date)
+
+@lru_cache(maxsize=2048)
 def _format_time(t):
     if not t:
         return ""
@@ -31,7 +67,7 @@ def _format_time(t):
 def _split_duration(hhmm: str | None):
     if not hhmm or ":" not in hhmm:
         return "", ""
-    h, m = hhmm.split(":")
+    h, _, m = hhmm.partition(":")
     return h, m
 
 def _decimal_hours(h, m):
@@ -39,26 +75,78 @@ def _decimal_hours(h, m):
         return ""
     return round(int(h) + int(m)/60, 2)
 
-def parse_timesheet(text: str) -> Dict:
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    date_pattern = re.compile(r"\d{2}\W?[A-Za-z]{3}\W?\d{2}")
+# Columns 8-13 for rows that don't carry the trip's duty/flight times
+_EMPTY_DURATION_CELLS = ("", "", "", "", "", "")
 
+def _duration_cells(f: FlightRow):
+    """Sheet columns 8-13: duty h/m/decimal then flight h/m/decimal."""
+    duty_h, duty_m = _split_duration(f.duty_time)
+    flight_h, flight_m = _split_duration(f.flight_time)
+    return (
+        duty_h, duty_m, _decimal_hours(duty_h, duty_m),
+        flight_h, flight_m, _decimal_hours(flight_h, flight_m),
+    )
+
+def _scan_times(line: str):
+    """Return (times, durations) found in a row in one pass over its tokens.
+
+    Clean tokens ("1720", "07:25") are classified directly. A token with digits
+    or a colon mixed with punctuation (e.g. "(1720)" or OCR-split "08 : 45")
+    falls back to a regex scan so results match the regexes exactly.
+    """
+    times = []
+    durations = []
+    for tok in line.split():
+        if tok.isalnum():
+            if len(tok) == 4 and tok.isdecimal():
+                times.append(tok)
+        elif len(tok) == 5 and tok[2] == ":" and tok[:2].isdecimal() and tok[3:].isdecimal():
+            durations.append(tok)
+        elif ":" in tok or any(c.isdecimal() for c in tok):
+            return _scan_times_regex(line)
+    return times, durations
+
+def _scan_times_regex(line: str):
+    times = []
+    durations = []
+    for m in TIMES_DURATIONS_REGEX.finditer(line):
+        if m.lastgroup == "time":
+            times.append(m.group())
+        else:
+            durations.append(m.group())
+    return times, durations
+
+def parse_timesheet(text: str) -> Dict:
     # Initialize list of FlightRow
     entries: List[FlightRow] = []
     current_date = None
+    current_day = None
 
-    for line in lines:
-        date_match = date_pattern.search(line)
+    # Stream lines straight from the text; each is stripped once, no copy list
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        # A date needs at least 7 characters ("01Mar26")
+        date_match = DATE_REGEX.search(line) if len(line) >= 7 else None
 
         if date_match:
             current_date = date_match.group().replace(" ", "")
-
-        if not current_date:
+            try:
+                current_day = _parse_date_str(current_date)
+            except ValueError:
+                # Unusual OCR shape; renderers parse (and report) it lazily
+                current_day = None
+
+        # Skip rows before the first date, and header rows
+        if not current_date or "Start Day Flight" in line or "Date Number Duty" in line:
             continue
 
         prev = entries[-1] if entries else None
         entry = _parse_row(current_date, line, prev)
         if entry:
+            entry.day = current_day
             entries.append(entry)
 
     return {
@@ -67,18 +155,19 @@ def parse_timesheet(text: str) -> Dict:
     }
 
 
-def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None:
+@lru_cache(maxsize=256)
+def _sector(origin: str, destination: str) -> str:
+    """A roster repeats the same few sectors; share one string per pair."""
+    return f"{origin}-{destination}"
 
-    # Ignore header rows
-    if "Start Day Flight" in line or "Date Number Duty" in line:
-        return None
+def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None:
 
     # Standby Duties (SS50, SS20, ..., STBY)
-    ss_match = re.search(STANDBY_DUTY_REGEX_STR, line)
+    # Cheap substring checks gate the regexes; most rows are flights
+    ss_match = STANDBY_DUTY_REGEX.search(line) if "SS" in line or "STBY" in line else None
     if ss_match:
-        times = re.findall(TIMES_REGEX_STR, line)
-        durations = re.findall(DURATIONS_REGEX_STR, line)
-        sector = re.findall(SINGLE_SECTOR_REGEX_STR, line)
+        times, durations = _scan_times(line)
+        sector = SINGLE_SECTOR_REGEX.findall(line)
         return FlightRow(
             start_date = date,
             flight_number = None,
@@ -94,21 +183,19 @@ def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None
         )
 
     # Off duty (ATDO, AALV, OFFD)
-    off_match = re.search(OFF_DUTY_REGEX_STR, line)
-    if off_match:
+    if line in OFF_DUTY_CODES:
         return FlightRow(
             start_date = date,
             flight_number = None,
             sector = 'SIN',
             origin = None,
             destination = None,
-            duty_type = off_match.group(),
+            duty_type = line,
         )
     
     # Layover days
-    lo_match = re.search(LAYOVER_REGEX_STR, line)
-    if lo_match:
-        country = re.search(SINGLE_SECTOR_REGEX_STR, line)
+    if "LO" in line and LAYOVER_REGEX.search(line):
+        country = SINGLE_SECTOR_REGEX.search(line)
         return FlightRow(
             start_date = date,
             flight_number = None,
@@ -119,20 +206,24 @@ def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None
         )
 
     # Flight Duty
-    flight_match = re.search(FLIGHT_NUMBER_REGEX_STR, line)
-    sector_match = re.search(SECTOR_REGEX_STR, line)
+    flight_match = FLIGHT_NUMBER_REGEX.search(line) if "SQ" in line else None
+    if not flight_match:
+        return None
 
-    if not flight_match or not sector_match:
+    sector_match = SECTOR_REGEX.search(line)
+    if not sector_match:
         return None
 
     flight_number = flight_match.group().replace(" ", "")
     origin, destination = sector_match.groups()
+    sector = _sector(origin, destination)
 
     same_flight_as_prev = (
-        prev
-        and prev.duty_type != "LO"
+        prev is not None
         and prev.flight_number == flight_number
-        and prev.sector == f"{origin}-{destination}"
+        and prev.duty_type != "LO"
+        and prev.origin == origin
+        and prev.destination == destination
     )
 
     is_turnaround = (
@@ -144,8 +235,7 @@ def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None
         and prev.destination == origin
     )
 
-    times = re.findall(TIMES_REGEX_STR, line)
-    durations = re.findall(DURATIONS_REGEX_STR, line)
+    times, durations = _scan_times(line)
 
     rpt = std = sta = None
     flight_time = duty_time = fdp = None
@@ -223,7 +313,7 @@ def _parse_row(date: str, line: str, prev: FlightRow | None) -> FlightRow | None
     return FlightRow(
         start_date = date,
         flight_number = flight_number,
-        sector = f"{origin}-{destination}",
+        sector = sector,
         origin = origin,
         destination = destination,
         duty_type = "FLY",
@@ -256,30 +346,33 @@ def group_trips(entries: list[FlightRow]) -> list[list[FlightRow]]:
     current = []
 
     for e in entries:
-        if e.duty_type and e.duty_type.startswith("SS"):
+        duty = e.duty_type
+
+        if duty and duty.startswith("SS"):
             if current:
                 trips.append(current)
                 current = []
             trips.append([e])
             continue
-        if e.duty_type == "STBY":
-            current.append(e)
-            continue
 
-        if e.duty_type == "LO":
+        # Standby and layover days belong to the trip in progress
+        if duty == "STBY" or duty == "LO":
             current.append(e)
             continue
 
-        if e.duty_type != "FLY":
+        if duty != "FLY":
             continue
 
+        origin = e.origin
+        destination = e.destination
+
         # Broken inbound at start of period
-        if not current and e.origin != "SIN" and e.destination == "SIN":
+        if not current and origin != "SIN" and destination == "SIN":
             trips.append([e])
             continue
 
         # Start trip
-        if not current and e.origin == "SIN":
+        if not current and origin == "SIN":
             current = [e]
             continue
 
@@ -287,7 +380,7 @@ def group_trips(entries: list[FlightRow]) -> list[list[FlightRow]]:
             current.append(e)
 
             # End trip when inbound arrives SIN and STA exists
-            if e.destination == "SIN" and e.sta:
+            if destination == "SIN" and e.sta:
                 trips.append(current)
                 current = []
 
@@ -298,9 +391,11 @@ def group_trips(entries: list[FlightRow]) -> list[list[FlightRow]]:
     return trips
 
 
-def trips_to_message(entries: List[FlightRow]) -> str:
+def trips_to_message(entries: List[FlightRow], trips: list[list[FlightRow]] | None = None) -> str:
 
-    trips = group_trips(entries)
+    # Callers rendering both views can group once and pass the trips in
+    if trips is None:
+        trips = group_trips(entries)
     # for trip in trips:
     #     print("=== Trip ===")
     #     for e in trip:
@@ -310,18 +405,18 @@ def trips_to_message(entries: List[FlightRow]) -> str:
     if not trips:
         return "No trips found."
 
-    first_date = _parse_date_str(trips[0][0].start_date)
-    month_name = first_date.strftime("%B").upper()
+    first_date = _entry_day(trips[0][0])
+    month_name = _MONTH_NAMES[first_date.month - 1]
 
     lines = [f"Flights for {month_name} {first_date.year}:"]
 
     for trip in trips:
         first_entry = trip[0]
-        start = _parse_date_str(first_entry.start_date).strftime("%d%b")
+        start = _format_day_month(_entry_day(first_entry))
 
         # Singapore Standby
         if first_entry.duty_type.startswith("SS"):
-            end = _parse_date_str(trip[-1].start_date).strftime("%d%b")
+            end = _format_day_month(_entry_day(trip[-1]))
             lines.append(
                 f"{start} - {end} | {first_entry.duty_type} | "
                 f"{_format_time(first_entry.rpt)} | {_format_time(first_entry.sta)}"
@@ -335,29 +430,26 @@ def trips_to_message(entries: List[FlightRow]) -> str:
             continue
 
         # Determine end date using last flight entry
+        first_flight = fly[0]
         last_flight = fly[-1]
-        end = _parse_date_str(last_flight.start_date).strftime("%d%b")
+        end = _format_day_month(_entry_day(last_flight))
+        prefix = f"{start} - {end} | {first_flight.sector} | "
 
         # Broken inbound only
-        if fly[0].origin != "SIN" and fly[0].destination == "SIN":
-            if fly[0].rpt:
-                row = f"{start} - {end} | {fly[0].sector} | "+f"{_format_time(fly[0].rpt)} ({fly[0].flight_number}) | "+f"{_format_time(fly[0].sta)} ({fly[0].flight_number})"
-            else:
-                row = f"{start} - {end} | {fly[0].sector} | - | "+f"{_format_time(fly[0].sta)} ({fly[0].flight_number})"
-            lines.append(row)
-            
+        if first_flight.origin != "SIN" and first_flight.destination == "SIN":
+            rpt = f"{_format_time(first_flight.rpt)} ({first_flight.flight_number})" if first_flight.rpt else "-"
+            lines.append(f"{prefix}{rpt} | {_format_time(first_flight.sta)} ({first_flight.flight_number})")
+
         # Broken Outbound only
-        elif fly[-1].destination != "SIN":
-            if last_flight.sta:
-                row = f"{start} - {end} | {fly[0].sector} | "+f"{_format_time(fly[0].rpt)} ({fly[0].flight_number}) | "+f"{_format_time(last_flight.sta)} ({last_flight.flight_number})"
-            else:
-                row = f"{start} - {end} | {fly[0].sector} | "+f"{_format_time(fly[0].rpt)} ({fly[0].flight_number}) | -"
-            lines.append(row)
-            
+        elif last_flight.destination != "SIN":
+            sta = f"{_format_time(last_flight.sta)} ({last_flight.flight_number})" if last_flight.sta else "-"
+            lines.append(f"{prefix}{_format_time(first_flight.rpt)} ({first_flight.flight_number}) | {sta}")
+
         else:
 
             outbound = next((e for e in fly if e.origin == "SIN"), None)
-            inbound = next((e for e in reversed(fly) if e.destination == "SIN"), None)
+            # This branch only runs when the last flight lands in SIN
+            inbound = last_flight
 
             if outbound and inbound:
                 lines.append(
@@ -368,7 +460,7 @@ def trips_to_message(entries: List[FlightRow]) -> str:
 
         # Overseas Standby (append AFTER trip)
         for s in stby:
-            stby_date = _parse_date_str(s.start_date).strftime("%d%b")
+            stby_date = _format_day_month(_entry_day(s))
             lines.append(
                 f"{stby_date} - {stby_date} | STBY ({s.sector}) | "
                 f"{_format_time(s.rpt)} | {_format_time(s.sta)}"
@@ -377,13 +469,13 @@ def trips_to_message(entries: List[FlightRow]) -> str:
     return "\n".join(lines)
 
 
-def trips_to_sheet_rows(entries: List[FlightRow]) -> list[list]:
-    trips = group_trips(entries)
+def trips_to_sheet_rows(entries: List[FlightRow], trips: list[list[FlightRow]] | None = None) -> list[list]:
+    # Callers rendering both views can group once and pass the trips in
+    if trips is None:
+        trips = group_trips(entries)
     rows = []
 
     for trip in trips:
-        trip_start_index = len(rows)
-
         # Skip SS standby
         if trip[0].duty_type.startswith("SS"):
             continue
@@ -394,147 +486,94 @@ def trips_to_sheet_rows(entries: List[FlightRow]) -> list[list]:
 
         is_turnaround_trip = all(f.trip_type == "Turnaround" for f in fly)
 
-        start_date = _parse_date_str(fly[0].start_date)
+        # Parse each flight's date once; reused for the span and the by-date map
+        fly_dates = [_entry_day(f) for f in fly]
+
+        start_date = fly_dates[0]
         last_flight = fly[-1]
 
         # Determine end date (handle overnight arrival)
-        end_date = _parse_date_str(last_flight.start_date)
-        if last_flight.sta and last_flight.rpt and int(last_flight.sta) < int(last_flight.rpt):
+        end_date = fly_dates[-1]
+        # Times are always 4-digit HHMM, so string order matches numeric order
+        if last_flight.sta and last_flight.rpt and last_flight.sta < last_flight.rpt:
             end_date += datetime.timedelta(days=1)
 
         days = (end_date - start_date).days + 1
-        all_dates = [start_date + datetime.timedelta(days=i) for i in range(days)]
 
         station = fly[0].destination if fly[0].origin == "SIN" else fly[0].origin
 
-        # Map flights by date
-        flights_by_date = {}
-        for f in fly:
-            d = _parse_date_str(f.start_date)
-            flights_by_date.setdefault(d, []).append(f)
-
-        for d in all_dates:
-            date_str = d.strftime("%m/%d/%Y")
-            todays = flights_by_date.get(d, [])
-
-            if is_turnaround_trip and todays:
-                for f in todays:
-                    dep = f.origin or ""
-                    arr = f.destination or ""
-
-                    ex_sin_rpt = _format_time(f.rpt) if dep == "SIN" else ""
-                    if dep == "SIN":
-                        if not f.sta and f.rpt:
-                            # First row of overnight outbound
-                            ex_sin_sta = "-"
-                        else:
-                            ex_sin_sta = _format_time(f.sta)
-                    elif arr == "SIN" and (not f.rpt and not f.std):
-                        # Second row of overnight inbound
-                        ex_sin_sta = "-"
-                    else:
-                        ex_sin_sta = ""
-                    ex_stn_rpt = _format_time(f.std if is_turnaround_trip else f.rpt) if arr == "SIN" else ""
-                    ex_stn_sta = _format_time(f.sta) if arr == "SIN" else ""
-
-                    duty_h, duty_m = _split_duration(f.duty_time)
-                    flight_h, flight_m = _split_duration(f.flight_time)
-
-                    rows.append([
-                        date_str, dep, arr, f.trip_type,
-                        ex_sin_rpt, ex_sin_sta,
-                        ex_stn_rpt, ex_stn_sta,
-                        duty_h, duty_m, _decimal_hours(duty_h, duty_m),
-                        flight_h, flight_m, _decimal_hours(flight_h, flight_m)
-                    ])
+        # Bucket flights by day offset; times are formatted once per flight
+        flights_by_day = [[] for _ in range(days)]
+        for f, d in zip(fly, fly_dates):
+            offset = (d - start_date).days
+            if 0 <= offset < days:
+                flights_by_day[offset].append((
+                    f,
+                    _format_time(f.rpt),
+                    _format_time(f.sta),
+                    _format_time(f.std),
+                ))
+
+        # Rows for this trip are built and post-processed here, then extended
+        trip_rows = []
+        base_ordinal = start_date.toordinal()
+        for offset, todays in enumerate(flights_by_day):
+            date_str = _format_sheet_date(datetime.date.fromordinal(base_ordinal + offset))
+
+            if not todays:
+                # Pure layover day
+                trip_rows.append([
+                    date_str, "", station, "Layover",
+                    "", "", "", "",
+                    *_EMPTY_DURATION_CELLS
+                ])
                 continue
 
-            if todays:
-                f = todays[0]
+            # Turnaround trips emit every flight of the day; others only the first
+            for f, rpt, sta, std in (todays if is_turnaround_trip else todays[:1]):
                 dep = f.origin or ""
                 arr = f.destination or ""
 
-                ex_sin_rpt = _format_time(f.rpt) if dep == "SIN" else ""
+                ex_sin_rpt = rpt if dep == "SIN" else ""
                 if dep == "SIN":
                     if not f.sta and f.rpt:
                         # First row of overnight outbound
                         ex_sin_sta = "-"
                     else:
-                        ex_sin_sta = _format_time(f.sta)
+                        ex_sin_sta = sta
                 elif arr == "SIN" and (not f.rpt and not f.std):
                     # Second row of overnight inbound
-                    ex_sin_sta = "-"                        
+                    ex_sin_sta = "-"
                 else:
                     ex_sin_sta = ""
+                ex_stn_rpt = (std if is_turnaround_trip else rpt) if arr == "SIN" else ""
+                ex_stn_sta = sta if arr == "SIN" else ""
 
-                ex_stn_rpt = _format_time(f.rpt) if arr == "SIN" else ""
-                ex_stn_sta = _format_time(f.sta) if arr == "SIN" else ""
-
-                duty_h, duty_m = _split_duration(f.duty_time)
-                flight_h, flight_m = _split_duration(f.flight_time)
-
-                rows.append([
+                trip_rows.append([
                     date_str, dep, arr, f.trip_type,
                     ex_sin_rpt, ex_sin_sta,
                     ex_stn_rpt, ex_stn_sta,
-                    duty_h, duty_m, _decimal_hours(duty_h, duty_m),
-                    flight_h, flight_m, _decimal_hours(flight_h, flight_m)
-                ])
-            else:
-                # Pure layover day
-                rows.append([
-                    date_str, "", station, "Layover",
-                    "", "", "", "",
-                    "", "", 0.0,
-                    "", "", 0
+                    *_EMPTY_DURATION_CELLS
                 ])
         # --- Post process this trip ---
-        trip_rows = rows[trip_start_index:]
         if not trip_rows:
             continue
 
         first_row = next(r for r in trip_rows if r[1] == fly[0].origin)
         last_row = next(r for r in reversed(trip_rows) if r[2] == fly[-1].destination)
 
-        # 1) Clear duty & flight times for ALL rows
-        for r in trip_rows:
-            r[8] = ""
-            r[9] = ""
-            r[10] = ""
-            r[11] = ""
-            r[12] = ""
-            r[13] = ""
-
-        # 2) Restore duty/flight only for first and last row
-        first_flight = fly[0]
-        last_flight = fly[-1]
-
-        duty_h, duty_m = _split_duration(first_flight.duty_time)
-        flight_h, flight_m = _split_duration(first_flight.flight_time)
-
-        first_row[8] = duty_h
-        first_row[9] = duty_m
-        first_row[10] = _decimal_hours(duty_h, duty_m)
-        first_row[11] = flight_h
-        first_row[12] = flight_m
-        first_row[13] = _decimal_hours(flight_h, flight_m)
-
-        duty_h, duty_m = _split_duration(last_flight.duty_time)
-        flight_h, flight_m = _split_duration(last_flight.flight_time)
-
-        last_row[8] = duty_h
-        last_row[9] = duty_m
-        last_row[10] = _decimal_hours(duty_h, duty_m)
-        last_row[11] = flight_h
-        last_row[12] = flight_m
-        last_row[13] = _decimal_hours(flight_h, flight_m)
+        # 1) Duty/flight times are only shown on the first and last row
+        first_row[8:14] = _duration_cells(fly[0])
+        last_row[8:14] = _duration_cells(fly[-1])
 
         if not is_turnaround_trip and len(trip_rows) > 2 :
-            # 3) Middle rows: only keep ARR as station country
+            # 2) Middle rows: only keep ARR as station country
             for r in trip_rows[1:-1]:
                 r[1] = ""  # clear dep
                 r[2] = first_row[2]  # keep arr
 
+        rows.extend(trip_rows)
+
     return rows
 
 
@@ -563,14 +602,16 @@ def validate_extracted_block(text: str, expected_month=None, expected_year=None)
 
 def parse_extracted_summary(text: str):
 
-    header = re.search(r"Flights\s+for\s+([A-Z]+)\s+(\d{4})", text)
+    header = SUMMARY_HEADER_REGEX.search(text)
     if not header:
         raise ValueError("Invalid header")
 
     month_name = header.group(1)
     year = int(header.group(2))
 
-    month = datetime.datetime.strptime(month_name, "%B").month
+    month = _MONTH_NAME_NUMBERS.get(month_name.upper())
+    if month is None:
+        raise ValueError(f"Unknown month {month_name!r}")
 
     lines = text.splitlines()
 
@@ -593,15 +634,15 @@ def parse_extracted_summary(text: str):
         date_part = parts[0]
         location = parts[1]
 
-        m = re.match(r"(\d{2})([A-Za-z]{3})\s*-\s*(\d{2})([A-Za-z]{3})", date_part)
+        m = SUMMARY_DATE_RANGE_REGEX.match(date_part)
         if not m:
             continue
 
         start_day = int(m.group(1))
         end_day = int(m.group(3))
 
-        rpt_time = re.search(r"(\d{2}:\d{2})", parts[2])
-        sta_time = re.search(r"(\d{2}:\d{2})", parts[3])
+        rpt_time = SUMMARY_TIME_REGEX.search(parts[2])
+        sta_time = SUMMARY_TIME_REGEX.search(parts[3])
 
         if not rpt_time or not sta_time:
             continue
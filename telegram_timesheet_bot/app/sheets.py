@@ -3,12 +3,17 @@ from __future__ import annotations
 import os
 import json
 import base64
+from functools import lru_cache
 from typing import List, Union
 
 import gspread
 
+GOOGLE_CREDS_B64 = os.getenv("GOOGLE_CREDS_B64")
+
+@lru_cache(maxsize=1)
 def _get_client():
-    creds_b64 = os.getenv("GOOGLE_CREDS_B64")
+    """Authorize once; the client's HTTP session is reused across appends."""
+    creds_b64 = GOOGLE_CREDS_B64
     if not creds_b64:
         raise RuntimeError("GOOGLE_CREDS_B64 not set")
 
@@ -25,6 +30,19 @@ def _get_client():
     return gspread.service_account_from_dict(creds_dict)
 
 
+@lru_cache(maxsize=32)
+def _get_worksheet(sheet_id: str, sheet_name: str | None = None):
+    """Open (or create) the target worksheet once per (sheet_id, sheet_name)."""
+    sh = _get_client().open_by_key(sheet_id)
+
+    if sheet_name:
+        try:
+            return sh.worksheet(sheet_name)
+        except Exception:
+            return sh.add_worksheet(title=sheet_name, rows=1000, cols=20)
+    return sh.sheet1
+
+
 def append_row(
     sheet_id: str,
     values: Union[List[str], List[List[str]]],
@@ -36,22 +54,24 @@ def append_row(
         - List[str]
         - List[List[str]]
     """
-    client = _get_client()
-    sh = client.open_by_key(sheet_id)
-
-    if sheet_name:
-        try:
-            ws = sh.worksheet(sheet_name)
-        except Exception:
-            ws = sh.add_worksheet(title=sheet_name, rows=1000, cols=20)
-    else:
-        ws = sh.sheet1
+    ws = _get_worksheet(sheet_id, sheet_name)
 
     if not values:
         return
 
-    ws.append_rows(
-        values if isinstance(values[0], list) else [values],
-        value_input_option="USER_ENTERED"
-    )
+    rows = values if isinstance(values[0], list) else [values]
+    try:
+        ws.append_rows(rows, value_input_option="USER_ENTERED")
+    except gspread.exceptions.APIError as e:
+        # Only a missing worksheet is worth a retry; quota and server errors
+        # may already have written the rows, so let those propagate
+        if getattr(e.response, "status_code", None) not in (400, 404):
+            raise
+
+        # The cached worksheet may have been renamed or deleted; reopen once
+        _get_worksheet.cache_clear()
+        fresh = _get_worksheet(sheet_id, sheet_name)
+        if fresh.id == ws.id:
+            raise
 
+        fresh.append_rows(rows, value_input_option="USER_ENTERED")
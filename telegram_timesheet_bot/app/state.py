@@ -1,5 +1,19 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import orjson
+
 CHAT_STATE: dict[int, dict] = {}
-PENDING_UPLOADS: dict[int, list[list]] = {}
+
+# Sheet rows awaiting a Yes/No confirmation live in SQLite so they survive
+# restarts, are visible to every worker process, and expire if never answered.
+PENDING_TTL_SECONDS = 600
+PENDING_DB_PATH = os.getenv(
+    "PENDING_DB_PATH",
+    str(Path(__file__).resolve().parent.parent / "pending_uploads.sqlite3"),
+)
 
 def get(chat_id: int):
     return CHAT_STATE.get(chat_id)
@@ -11,4 +25,51 @@ def update(chat_id: int, **kwargs):
     CHAT_STATE.setdefault(chat_id, {}).update(kwargs)
 
 def clear(chat_id: int):
-    CHAT_STATE.pop(chat_id, None)
\ No newline at end of file
+    CHAT_STATE.pop(chat_id, None)
+
+
+_pending_db_ready = False
+
+def _pending_db() -> sqlite3.Connection:
+    # Created on first use so importing the app never touches the filesystem
+    global _pending_db_ready
+
+    # autocommit mode; transactions are opened explicitly where needed
+    conn = sqlite3.connect(PENDING_DB_PATH, timeout=5, isolation_level=None)
+    if not _pending_db_ready:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending_uploads ("
+            "chat_id INTEGER PRIMARY KEY, rows BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        _pending_db_ready = True
+    return conn
+
+def set_pending(chat_id: int, rows: list[list]):
+    now = time.time()
+    conn = _pending_db()
+    try:
+        conn.execute("DELETE FROM pending_uploads WHERE expires_at < ?", (now,))
+        conn.execute(
+            "INSERT OR REPLACE INTO pending_uploads VALUES (?, ?, ?)",
+            (chat_id, orjson.dumps(rows), now + PENDING_TTL_SECONDS),
+        )
+    finally:
+        conn.close()
+
+def pop_pending(chat_id: int) -> list[list] | None:
+    conn = _pending_db()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT rows, expires_at FROM pending_uploads WHERE chat_id = ?",
+            (chat_id,),
+        ).fetchone()
+        conn.execute("DELETE FROM pending_uploads WHERE chat_id = ?", (chat_id,))
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+    if not row or row[1] < time.time():
+        return None
+    return orjson.loads(row[0])
+
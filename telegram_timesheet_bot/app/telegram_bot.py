@@ -3,11 +3,32 @@ This keeps dependencies minimal and avoids long callback setups.
 """
 from __future__ import annotations
 import os
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
 
 TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 API_URL = f"https://api.telegram.org/bot{TOKEN}"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive session per process so Bot API calls reuse TCP/TLS connections.
+# Background tasks share it from the threadpool. Retries only cover failures to
+# establish a connection; a POST that dies on a reused connection is not retried.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://api.telegram.org/",
+    HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2)),
+)
+
+
+def _post_json(method: str, payload: dict) -> requests.Response:
+    return _SESSION.post(
+        f"{API_URL}/{method}",
+        data=orjson.dumps(payload),
+        headers=JSON_HEADERS,
+    )
 
 
 def send_message(chat_id: int, text: str, reply_markup=None) -> dict:
@@ -18,26 +39,27 @@ def send_message(chat_id: int, text: str, reply_markup=None) -> dict:
     if reply_markup:
         payload["reply_markup"] = reply_markup
 
-    url = f"{API_URL}/sendMessage"
-    res = requests.post(url, json=payload)
-    return res.json()
+    res = _post_json("sendMessage", payload)
+    return orjson.loads(res.content)
 
 
 def get_file_info(file_id: str) -> dict:
     url = f"{API_URL}/getFile"
-    res = requests.get(url, params={"file_id": file_id}, timeout=10)
-    return res.json().get("result") or {}
+    res = _SESSION.get(url, params={"file_id": file_id}, timeout=10)
+    return orjson.loads(res.content).get("result") or {}
 
 
 def download_file(file_path: str) -> bytes | None:
     file_url = f"https://api.telegram.org/file/bot{TOKEN}/{file_path}"
-    r = requests.get(file_url)
+    r = _SESSION.get(file_url)
     if r.status_code == 200:
         return r.content
     return None
 
-def answer_callback_query(callback_query_id):
-    requests.post(
-        f"{API_URL}/answerCallbackQuery",
-        json={"callback_query_id": callback_query_id}
-    )
\ No newline at end of file
+def answer_callback_query(callback_query_id, text: Optional[str] = None, show_alert: bool = False):
+    payload = {"callback_query_id": callback_query_id}
+    if text:
+        payload["text"] = text
+        payload["show_alert"] = show_alert
+
+    _post_json("answerCallbackQuery", payload)
\ No newline at end of file
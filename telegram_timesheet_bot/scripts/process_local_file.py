@@ -4,12 +4,16 @@ Prints the reply message and the sheet row that would be appended.
 Optionally append to Google Sheets if `--append` is given and `SHEET_ID` is set.
 
 Usage:
-  python scripts/process_local_file.py path/to/file.jpg [--chat 12345] [--append]
+  python scripts/process_local_file.py path/to/file.jpg [more files...] [--chat 12345] [--append]
+
+With several files, OCR runs concurrently; results are printed in the order
+the files were given, and `--append` uploads all of their rows in one call.
 """
 import sys
 import os
 import base64
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure project root is on sys.path so `from app import ...` works when
@@ -21,11 +25,28 @@ from scripts.run_tests import entries_to_string
 from dotenv import load_dotenv
 load_dotenv()
 
-from app import ocr, sheets, service, models
+# app.ocr (Vision/gRPC) and app.sheets (gspread) are slow to import, so they
+# are imported where used; --mock runs without --append never load them.
+from app import service
+
+def read_file(path: str) -> bytes:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        print("Cannot open:", path, e)
+        sys.exit(1)
+
+
+def extract_text(path: str, data: bytes) -> str:
+    from app import ocr
+
+    return ocr.extract_text_from_file(data, filename=path)
+
 
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument("file", help="Path to image or PDF")
+    p.add_argument("files", nargs="+", help="Path(s) to image or PDF")
     p.add_argument("--chat", type=int, help="Chat id to include in row/reply")
     p.add_argument("--append", action="store_true", help="Actually append to Google Sheet (requires SHEET_ID + creds)")
     p.add_argument("--mock", help="Path to raw OCR text file (skip Vision API)")
@@ -34,20 +55,46 @@ def main():
     p.add_argument("--snapshot-row", help="Path to save snapshot of sheet row for debugging")
     args = p.parse_args()
 
-    path = args.file
-    if not os.path.exists(path):
-        print("File not found:", path)
+    if len(args.files) > 1 and (args.snapshot_entries or args.snapshot_reply or args.snapshot_row):
+        print("Snapshots can only be written for a single file.")
+        sys.exit(1)
+
+    if len(args.files) > 1 and args.mock:
+        print("Mock OCR text can only be used with a single file.")
         sys.exit(1)
 
     if args.mock:
         print("Using mock OCR text from:", args.mock)
-        with open(args.mock, "r", encoding="utf-8") as f:
-            extracted_text = f.read()
+        mock_text = read_file(args.mock).decode("utf-8")
+        texts = [mock_text]
     else:
-        with open(path, "rb") as f:
-            data = f.read()
-        extracted_text = ocr.extract_text_from_file(data, filename=path)
-        
+        # Read every input first so a bad path fails before any OCR is paid for
+        blobs = [read_file(path) for path in args.files]
+
+        # Vision OCR is network-bound, so overlap it across files with threads
+        with ThreadPoolExecutor(max_workers=min(8, len(args.files))) as ex:
+            texts = list(ex.map(extract_text, args.files, blobs))
+
+    rows = []
+    for path, extracted_text in zip(args.files, texts):
+        if len(args.files) > 1:
+            print(f"=== {path} ===")
+        rows.extend(process_text(extracted_text, args))
+
+    if args.append:
+        sheet_id = os.getenv("SHEET_ID")
+        if not sheet_id:
+            print("SHEET_ID not set; cannot append. Set SHEET_ID env var to enable append.")
+            sys.exit(1)
+        sheet_name = os.getenv("SHEET_NAME")
+        print("Appending to sheet... (sheet: %s)" % (sheet_name or 'sheet1'))
+        # Rows from every file go up in a single append_rows call
+        from app import sheets
+        sheets.append_row(sheet_id, rows, sheet_name=sheet_name)
+        print("Appended.")
+
+
+def process_text(extracted_text: str, args) -> list[list]:
     # print("=== RAW OCR TEXT ===")
     # print(extracted_text)
     # print("====================")
@@ -78,22 +125,13 @@ def main():
                 f.write(f"{i}: {v}\n")
         print(f"Snapshot of sheet row saved to {args.snapshot_row}")
 
-    print("--- Reply message ---")
-    print(reply)
-    print()
-    print("--- Sheet row (ready to append) ---")
+    out = ["--- Reply message ---", reply, "", "--- Sheet row (ready to append) ---"]
     for i, v in enumerate(row, 1):
-        print(f"{i}:", (v if len(str(v)) < 200 else str(v)[:200] + '...'))
+        text = str(v)
+        out.append(f"{i}: {text if len(text) < 200 else text[:200] + '...'}")
+    sys.stdout.write("\n".join(out) + "\n")
 
-    if args.append:
-        sheet_id = os.getenv("SHEET_ID")
-        if not sheet_id:
-            print("SHEET_ID not set; cannot append. Set SHEET_ID env var to enable append.")
-            sys.exit(1)
-        sheet_name = os.getenv("SHEET_NAME")
-        print("Appending to sheet... (sheet: %s)" % (sheet_name or 'sheet1'))
-        sheets.append_row(sheet_id, row, sheet_name=sheet_name)
-        print("Appended.")
+    return row
 
 
 if __name__ == "__main__":
@@ -1,134 +1,142 @@
 import difflib
 import pathlib
+import re
 import sys
+import tempfile
+from functools import lru_cache
+from operator import attrgetter
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
-from app import service, models
+from app import service, models, state
 
 TESTS = {"nov25", "dec25", "mar26", "apr26Brandon", "apr26Bing"}
 
+ENTRY_FIELDS = attrgetter(
+    "start_date", "arrival_date",
+    "flight_number", "sector", "duty_type",
+    "rpt", "std", "sta",
+    "flight_time", "duty_time", "fdp",
+)
+
 def entries_to_string(entries: list[models.FlightRow]) -> str:
-    lines = []
-    for e in entries:
-        lines.append(
-            f"{e.start_date} | {e.arrival_date} | "
-            f"{e.flight_number} | {e.sector} | {e.duty_type} | "
-            f"{e.rpt} | {e.std} | {e.sta} | "
-            f"{e.flight_time} | {e.duty_time} | {e.fdp} | "
-        )
-    return "\n".join(lines)
-
-def test_entries_snapshot(filename: str):
+    # Every field is followed by " | ", including the last one
+    return "\n".join(
+        " | ".join(map(str, ENTRY_FIELDS(e))) + " | "
+        for e in entries
+    )
+
+DIFF_WINDOW = 50
+HUNK_HEADER = re.compile(r"-(\d+)(,\d+)? \+(\d+)(,\d+)?")
+
+def snapshot_diff(expected: list[str], actual: list[str]) -> str:
+    """Unified diff around the first mismatch only.
+
+    difflib gets superlinear on long, badly diverged inputs, so it is only fed a
+    window of DIFF_WINDOW lines either side of where the snapshots first differ.
+    """
+    first = next(
+        (i for i, (x, y) in enumerate(zip(expected, actual)) if x != y),
+        min(len(expected), len(actual)),
+    )
+    start = max(0, first - DIFF_WINDOW)
+    end = first + DIFF_WINDOW
+
+    # After an insertion/deletion the longer side needs a longer window, or the
+    # slices end on different logical lines and the tail shows phantom changes
+    delta = min(abs(len(actual) - len(expected)), DIFF_WINDOW)
+    expected_end = end + (delta if len(expected) > len(actual) else 0)
+    actual_end = end + (delta if len(actual) > len(expected) else 0)
+
+    lines = difflib.unified_diff(
+        expected[start:expected_end],
+        actual[start:actual_end],
+        fromfile="expected",
+        tofile="actual",
+        lineterm=""
+    )
+    # Hunk headers are relative to the window; shift them back to file lines
+    def shift(m: re.Match) -> str:
+        return f"-{int(m[1]) + start}{m[2] or ''} +{int(m[3]) + start}{m[4] or ''}"
+
+    return "\n".join(
+        HUNK_HEADER.sub(shift, line, count=1) if line.startswith("@@") else line
+        for line in lines
+    )
+
+def render_entries(entries: list[models.FlightRow]) -> list[str]:
+    return entries_to_string(entries).strip().splitlines()
+
+def render_reply(entries: list[models.FlightRow]) -> list[str]:
+    return service.trips_to_message(entries).strip().splitlines()
+
+def render_sheet_rows(entries: list[models.FlightRow]) -> list[str]:
+    return [f"{i}: {v}" for i, v in enumerate(service.trips_to_sheet_rows(entries), 1)]
+
+# (snapshot file suffix, suite name, per-fixture label, renderer)
+SNAPSHOT_SUITES = (
+    ("entries", "parsing", "entries", render_entries),
+    ("reply", "reply message", "reply", render_reply),
+    ("row", "sheet row", "sheet row", render_sheet_rows),
+)
+
+@lru_cache(maxsize=None)
+def parse_fixture(filename: str) -> list[models.FlightRow]:
+    """Parse each fixture once; every suite renders from the same entries."""
     raw_path = ROOT / "tests" / f"{filename}_extracted.txt"
-    expected_path = ROOT / "tests" / "snapshots" / f"{filename}_entries.txt"
-    
-    if not expected_path.exists():
-        print(f"  - {filename} sheet row snapshot not found, skipping test")
-        return
-
-    raw_text = raw_path.read_text()
-    expected = expected_path.read_text().strip()
-
-    result = service.parse_timesheet(raw_text)
-    actual = entries_to_string(result["entries"]).strip()
+    return service.parse_timesheet(raw_path.read_text())["entries"]
 
-    if actual != expected:
-        diff = "\n".join(
-            difflib.unified_diff(
-                expected.splitlines(),
-                actual.splitlines(),
-                fromfile="expected",
-                tofile="actual",
-                lineterm=""
-            )
-        )
-        raise AssertionError(diff)
-
-    print(f"  - {filename} entries snapshot OK")
-
-def parsing_test():
-    print("=== Running parsing tests against snapshots ===")
-    for test in TESTS:
-        test_entries_snapshot(test)
-    print("All parsing snapshot tests passed!")
-    print("===============================================")
-
-def test_reply_snapshot(filename: str):
-    raw_path = ROOT / "tests" / f"{filename}_extracted.txt"
-    expected_path = ROOT / "tests" / "snapshots" / f"{filename}_reply.txt"
+def test_snapshot(filename: str, suffix: str, label: str, render):
+    expected_path = ROOT / "tests" / "snapshots" / f"{filename}_{suffix}.txt"
 
     if not expected_path.exists():
-        print(f"  - {filename} sheet row snapshot not found, skipping test")
+        print(f"  - {filename} {label} snapshot not found, skipping test")
         return
 
-    raw_text = raw_path.read_text()
-    expected = expected_path.read_text().strip()
-
-    result = service.parse_timesheet(raw_text)
-    actual = service.trips_to_message(result["entries"]).strip()
+    expected = expected_path.read_text().strip().splitlines()
+    actual = render(parse_fixture(filename))
 
     if actual != expected:
-        diff = "\n".join(
-            difflib.unified_diff(
-                expected.splitlines(),
-                actual.splitlines(),
-                fromfile="expected",
-                tofile="actual",
-                lineterm=""
-            )
-        )
-        raise AssertionError(diff)
-
-    print(f"  - {filename} reply snapshot OK")
-
-def reply_test():
-    print("=== Running reply message tests against snapshots ===")
-    for test in TESTS:
-        test_reply_snapshot(test)
-    print("All reply message snapshot tests passed!")
-    print("=====================================================")
-
-def test_sheet_row_snapshot(filename: str):
-    raw_path = ROOT / "tests" / f"{filename}_extracted.txt"
-    expected_path = ROOT / "tests" / "snapshots" / f"{filename}_row.txt"
-
-    if not expected_path.exists():
-        print(f"  - {filename} sheet row snapshot not found, skipping test")
-        return
+        raise AssertionError(snapshot_diff(expected, actual))
 
-    raw_text = raw_path.read_text()
-    expected = expected_path.read_text().strip().splitlines()
+    print(f"  - {filename} {label} snapshot OK")
 
-    result = service.parse_timesheet(raw_text)
-    actual_rows = service.trips_to_sheet_rows(result["entries"])
-    actual = [f"{i}: {v}" for i, v in enumerate(actual_rows, 1)]
-
-    if actual != expected:
-        diff = "\n".join(
-            difflib.unified_diff(
-                expected,
-                actual,
-                fromfile="expected",
-                tofile="actual",
-                lineterm=""
-            )
-        )
-        raise AssertionError(diff)
-
-    print(f"  - {filename} sheet row snapshot OK")
-
-def sheet_row_test():
-    print("=== Running sheet row tests against snapshots ===")
+def snapshot_test(suffix: str, suite: str, label: str, render):
+    header = f"=== Running {suite} tests against snapshots ==="
+    print(header)
     for test in TESTS:
-        test_sheet_row_snapshot(test)
-    print("All sheet row snapshot tests passed!")
-    print("================================================")
+        test_snapshot(test, suffix, label, render)
+    print(f"All {suite} snapshot tests passed!")
+    print("=" * len(header))
+
+def pending_store_test():
+    header = "=== Running pending upload store tests ==="
+    print(header)
+    with tempfile.TemporaryDirectory() as tmp:
+        state.PENDING_DB_PATH = str(pathlib.Path(tmp) / "pending.sqlite3")
+        state._pending_db_ready = False
+        rows = [["01MAR", "SQ321"], ["02MAR", "SQ322"]]
+
+        state.set_pending(1, rows)
+        assert state.pop_pending(1) == rows, "pending rows not returned"
+        assert state.pop_pending(1) is None, "pending rows popped twice"
+        print("  - set/pop returns the rows once OK")
+
+        state.set_pending(2, rows)
+        conn = state._pending_db()
+        try:
+            conn.execute("UPDATE pending_uploads SET expires_at = 0 WHERE chat_id = 2")
+        finally:
+            conn.close()
+        assert state.pop_pending(2) is None, "expired pending rows returned"
+        print("  - expired rows are not returned OK")
+    print("All pending upload store tests passed!")
+    print("=" * len(header))
 
 def main():
-    parsing_test()
-    reply_test()
-    sheet_row_test()
+    for suite in SNAPSHOT_SUITES:
+        snapshot_test(*suite)
+    pending_store_test()
     print("All tests passed!")
 
 
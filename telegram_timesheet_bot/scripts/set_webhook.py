@@ -7,8 +7,11 @@ It will use WEBHOOK_PATH from env or default `webhook`.
 """
 import os
 import sys
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # load .env if present
 load_dotenv()
@@ -29,7 +32,22 @@ def main():
     webhook_url = f"{base}/{path}"
 
     set_url = f"https://api.telegram.org/bot{token}/setWebhook"
-    res = requests.post(set_url, json={"url": webhook_url})
+    # setWebhook is idempotent, so retrying the POST on 429/5xx is safe
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(max_retries=retry))
+        res = session.post(
+            set_url,
+            data=orjson.dumps({"url": webhook_url}),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
     print(res.status_code, res.text)
 
 